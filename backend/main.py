@@ -1,22 +1,58 @@
 """
 FastAPI backend for ModelGuard
 """
+import asyncio
+import multiprocessing
 import os
+import secrets
 import tempfile
 import time
-from typing import Dict
-from fastapi import FastAPI, File, UploadFile, HTTPException
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+import orjson
+from fastapi import FastAPI, File, UploadFile, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+try:
+    from blake3 import blake3 as content_hasher
+except ImportError:
+    # BLAKE2b from the standard library is slower but always available
+    from hashlib import blake2b as content_hasher
 
 from .models import ValidationReport, HealthResponse
+from .storage import ReportStore
 from .validator import MeshValidator
 
+# Validation is CPU-bound, so it runs in worker processes to keep the event loop free.
+# Workers are spawned rather than forked because the validator may already have
+# started Numba's thread pool in this process, which is not safe to fork.
+# start_backend.py sets MG_POOL_WORKERS to share the cores between server processes.
+VALIDATION_WORKERS = int(os.getenv("MG_POOL_WORKERS", os.cpu_count() or 1))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start a validation pool for each app run and shut it down with the app"""
+    app.state.validation_pool = ProcessPoolExecutor(
+        max_workers=VALIDATION_WORKERS,
+        mp_context=multiprocessing.get_context("spawn")
+    )
+    try:
+        yield
+    finally:
+        app.state.validation_pool.shutdown(cancel_futures=True)
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="ModelGuard API",
     description="3D Model Validation Service for Dental Models",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -28,11 +64,22 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses (report lists, reports with many issues)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Initialize validator
 validator = MeshValidator()
 
-# In-memory storage for reports (use database in production)
-reports_storage: Dict[str, ValidationReport] = {}
+# Bounded in-memory storage for reports (use database in production)
+reports_storage = ReportStore(maxsize=1024, ttl_seconds=3600)
+
+# Uploads are copied to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# Accepted uploads
+ALLOWED_EXTENSIONS = {'.stl', '.obj', '.ply'}
+MAX_UPLOAD_SIZE = 100 * 1024 * 1024  # 100MB
+MAX_BATCH_FILES = 20
 
 # Track uptime
 start_time = time.time()
@@ -46,6 +93,79 @@ async def health_check():
     )
 
 
+def check_upload(file: UploadFile) -> str:
+    """
+    Reject unsupported or oversized uploads
+    
+    Returns:
+        The lower-cased file extension
+    """
+    file_extension = os.path.splitext(file.filename)[1].lower()
+    
+    if file_extension not in ALLOWED_EXTENSIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported file type. Allowed: {', '.join(ALLOWED_EXTENSIONS)}"
+        )
+    
+    if file.size and file.size > MAX_UPLOAD_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail="File too large. Maximum size: 100MB"
+        )
+    
+    return file_extension
+
+
+async def save_upload(file: UploadFile, file_extension: str) -> Tuple[str, str]:
+    """
+    Stream an upload to a temporary file in chunks so large models never sit
+    in memory, hashing the content on the way
+    
+    Returns:
+        Path of the temporary file and the content hash used as cache key
+    """
+    hasher = content_hasher()
+    with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as tmp_file:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            hasher.update(chunk)
+            tmp_file.write(chunk)
+    
+    # The extension decides how the bytes are parsed, so it is part of the key
+    return tmp_file.name, f"{file_extension}:{hasher.hexdigest()}"
+
+
+def remove_temp_files(paths: List[str]) -> None:
+    """Delete temporary upload files, ignoring ones already gone"""
+    for path in paths:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def reuse_cached_report(content_hash: str, filename: str) -> Optional[bytes]:
+    """
+    Record a new report for an upload whose content was already validated
+    
+    The cached results are copied under a new model ID with this upload's
+    filename and timestamp, so the history shows every upload.
+    
+    Returns:
+        The new report serialized as JSON, or None if the content is not cached
+    """
+    cached_json = reports_storage.get_by_hash(content_hash)
+    if cached_json is None:
+        return None
+    
+    report = ValidationReport.model_validate_json(cached_json).model_copy(update={
+        "model_id": secrets.token_hex(16),
+        "filename": filename,
+        "timestamp": datetime.utcnow().isoformat()
+    })
+    return reports_storage.add(report, content_hash)
+
+
 @app.post("/validate", response_model=ValidationReport)
 async def validate_model(file: UploadFile = File(...)):
     """
@@ -57,39 +177,95 @@ async def validate_model(file: UploadFile = File(...)):
     Returns:
         Validation report with errors, warnings, and decision
     """
-    # Validate file type
-    allowed_extensions = {'.stl', '.obj', '.ply'}
-    file_extension = os.path.splitext(file.filename)[1].lower()
+    file_extension = check_upload(file)
+    tmp_file_path, content_hash = await save_upload(file, file_extension)
     
-    if file_extension not in allowed_extensions:
+    try:
+        # Identical uploads reuse the cached results without revalidating
+        report_json = reuse_cached_report(content_hash, file.filename)
+        if report_json is not None:
+            return Response(content=report_json, media_type="application/json")
+        
+        # Validate the mesh in a worker process
+        loop = asyncio.get_running_loop()
+        report = await loop.run_in_executor(
+            app.state.validation_pool, validator.validate_mesh, tmp_file_path, file.filename
+        )
+        
+        # Store report in memory and return the already-serialized JSON
+        report_json = reports_storage.add(report, content_hash)
+        
+        return Response(content=report_json, media_type="application/json")
+        
+    except Exception as e:
         raise HTTPException(
-            status_code=400,
-            detail=f"Unsupported file type. Allowed: {', '.join(allowed_extensions)}"
+            status_code=500,
+            detail=f"Validation failed: {str(e)}"
         )
     
-    # Check file size (100MB limit)
-    max_size = 100 * 1024 * 1024  # 100MB
-    if file.size and file.size > max_size:
+    finally:
+        remove_temp_files([tmp_file_path])
+
+
+@app.post("/validate/batch", response_model=List[ValidationReport])
+async def validate_batch(files: List[UploadFile] = File(...)):
+    """
+    Validate several 3D model files in one request
+    
+    Args:
+        files: Uploaded 3D model files (STL, OBJ, PLY)
+        
+    Returns:
+        Validation reports in the order the files were uploaded
+    """
+    if len(files) > MAX_BATCH_FILES:
         raise HTTPException(
             status_code=413,
-            detail="File too large. Maximum size: 100MB"
+            detail=f"Too many files. Maximum per batch: {MAX_BATCH_FILES}"
         )
     
-    # Save uploaded file temporarily
-    with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as tmp_file:
-        content = await file.read()
-        tmp_file.write(content)
-        tmp_file_path = tmp_file.name
+    file_extensions = [check_upload(file) for file in files]
     
+    tmp_file_paths = []
+    content_hashes = []
     try:
-        # Validate the mesh
-        report = validator.validate_mesh(tmp_file_path, file.filename)
+        for file, file_extension in zip(files, file_extensions):
+            tmp_file_path, content_hash = await save_upload(file, file_extension)
+            tmp_file_paths.append(tmp_file_path)
+            content_hashes.append(content_hash)
         
-        # Store report in memory
-        reports_storage[report.model_id] = report
+        # Cached reports are reused, everything else goes to the pool in one map
+        # call so the validator is pickled once per chunk rather than per file
+        results = [
+            reuse_cached_report(content_hash, file.filename)
+            for content_hash, file in zip(content_hashes, files)
+        ]
         
-        return report
+        # Files with the same content are validated once: the first one goes to
+        # the pool and the copies reuse its report
+        pending: Dict[str, List[int]] = {}
+        for i, (content_hash, report_json) in enumerate(zip(content_hashes, results)):
+            if report_json is None:
+                pending.setdefault(content_hash, []).append(i)
         
+        if pending:
+            first = [indices[0] for indices in pending.values()]
+            chunksize = max(1, len(first) // (VALIDATION_WORKERS * 4))
+            loop = asyncio.get_running_loop()
+            reports = await loop.run_in_executor(None, lambda: list(app.state.validation_pool.map(
+                validator.validate_mesh,
+                [tmp_file_paths[i] for i in first],
+                [files[i].filename for i in first],
+                chunksize=chunksize
+            )))
+            
+            for indices, report in zip(pending.values(), reports):
+                results[indices[0]] = reports_storage.add(report, content_hashes[indices[0]])
+                for i in indices[1:]:
+                    results[i] = reuse_cached_report(content_hashes[i], files[i].filename)
+        
+        return Response(content=b"[" + b",".join(results) + b"]", media_type="application/json")
+    
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -97,11 +273,7 @@ async def validate_model(file: UploadFile = File(...)):
         )
     
     finally:
-        # Clean up temporary file
-        try:
-            os.unlink(tmp_file_path)
-        except OSError:
-            pass
+        remove_temp_files(tmp_file_paths)
 
 
 @app.get("/report/{model_id}", response_model=ValidationReport)
@@ -115,41 +287,46 @@ async def get_report(model_id: str):
     Returns:
         Validation report
     """
-    if model_id not in reports_storage:
+    report_json = reports_storage.get(model_id)
+    if report_json is None:
         raise HTTPException(
             status_code=404,
             detail="Report not found"
         )
     
-    return reports_storage[model_id]
+    return Response(content=report_json, media_type="application/json")
 
 
 @app.get("/reports")
-async def list_reports():
-    """List all validation reports"""
-    return {
-        "reports": [
-            {
-                "model_id": report.model_id,
-                "filename": report.filename,
-                "decision": report.decision,
-                "timestamp": report.timestamp
-            }
-            for report in reports_storage.values()
-        ]
-    }
+async def list_reports(limit: int = Query(100, ge=1, le=1000),
+                       offset: int = Query(0, ge=0)):
+    """
+    List validation reports, oldest first
+    
+    Args:
+        limit: Maximum number of reports to return
+        offset: Number of reports to skip
+    """
+    summaries = reports_storage.summaries(offset=offset, limit=limit)
+    
+    def encode() -> Iterator[bytes]:
+        yield b'{"reports":['
+        for i, summary in enumerate(summaries):
+            yield (b',' if i else b'') + orjson.dumps(summary)
+        yield b']}'
+    
+    return StreamingResponse(encode(), media_type="application/json")
 
 
 @app.delete("/report/{model_id}")
 async def delete_report(model_id: str):
     """Delete a validation report"""
-    if model_id not in reports_storage:
+    if not reports_storage.delete(model_id):
         raise HTTPException(
             status_code=404,
             detail="Report not found"
         )
     
-    del reports_storage[model_id]
     return {"message": "Report deleted successfully"}
 
 
@@ -0,0 +1,132 @@
+"""
+Bounded in-memory storage for validation reports
+"""
+import time
+from collections import OrderedDict
+from itertools import islice
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from .models import ValidationReport
+
+
+class _StoredReport(NamedTuple):
+    """A serialized report plus the slim summary used by the list endpoint"""
+    expires_at: float
+    json_bytes: bytes
+    summary: Dict[str, Any]
+    content_hash: Optional[str]
+
+
+class ReportStore:
+    """
+    In-memory report store with a size bound and a time-to-live
+
+    Reports are serialized to JSON once on insert so reads never go through
+    Pydantic again. When the store is full the oldest report is evicted.
+    Reports can also be looked up by the hash of the uploaded file, so
+    re-uploads of identical content skip validation.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl_seconds: float = 3600.0):
+        """
+        Initialize an empty store
+
+        Args:
+            maxsize: Maximum number of reports kept
+            ttl_seconds: Seconds a report is kept after it is added
+        """
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._reports: "OrderedDict[str, _StoredReport]" = OrderedDict()
+        self._hash_to_model_id: Dict[str, str] = {}
+
+    def add(self, report: ValidationReport, content_hash: Optional[str] = None) -> bytes:
+        """
+        Serialize and store a report, evicting the oldest ones if needed
+
+        Args:
+            report: Report to store
+            content_hash: Hash of the validated file, for get_by_hash
+
+        Returns:
+            The report serialized as JSON
+        """
+        self._purge_expired()
+
+        self._remove(report.model_id)
+        while len(self._reports) >= self.maxsize:
+            self._remove(next(iter(self._reports)))
+
+        json_bytes = report.model_dump_json().encode()
+        self._reports[report.model_id] = _StoredReport(
+            expires_at=time.monotonic() + self.ttl_seconds,
+            json_bytes=json_bytes,
+            summary={
+                "model_id": report.model_id,
+                "filename": report.filename,
+                "decision": report.decision.value,
+                "timestamp": report.timestamp
+            },
+            content_hash=content_hash
+        )
+        if content_hash is not None:
+            self._hash_to_model_id[content_hash] = report.model_id
+        return json_bytes
+
+    def get(self, model_id: str) -> Optional[bytes]:
+        """Return the serialized report, or None if it is missing or expired"""
+        entry = self._reports.get(model_id)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(model_id)
+            return None
+        return entry.json_bytes
+
+    def get_by_hash(self, content_hash: str) -> Optional[bytes]:
+        """Return the serialized report for a file hash, or None if not cached"""
+        model_id = self._hash_to_model_id.get(content_hash)
+        return None if model_id is None else self.get(model_id)
+
+    def delete(self, model_id: str) -> bool:
+        """Remove a report, returning whether it was present"""
+        return self._remove(model_id)
+
+    def summaries(self, offset: int = 0, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Slim summaries of live reports, oldest first
+
+        Args:
+            offset: Number of reports to skip
+            limit: Maximum number of summaries to return (all if None)
+        """
+        self._purge_expired()
+        stop = None if limit is None else offset + limit
+        return [entry.summary for entry in islice(self._reports.values(), offset, stop)]
+
+    def __contains__(self, model_id: str) -> bool:
+        return self.get(model_id) is not None
+
+    def __len__(self) -> int:
+        self._purge_expired()
+        return len(self._reports)
+
+    def _purge_expired(self) -> None:
+        """Drop expired reports (insertion order is also expiry order)"""
+        now = time.monotonic()
+        while self._reports:
+            model_id, entry = next(iter(self._reports.items()))
+            if entry.expires_at > now:
+                break
+            self._remove(model_id)
+
+    def _remove(self, model_id: str) -> bool:
+        """Drop a report and its hash entry, returning whether it was present"""
+        entry = self._reports.pop(model_id, None)
+        if entry is None:
+            return False
+        # The hash may already point at a newer report of the same content
+        if (entry.content_hash is not None
+                and self._hash_to_model_id.get(entry.content_hash) == model_id):
+            del self._hash_to_model_id[entry.content_hash]
+        return True
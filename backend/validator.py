@@ -1,9 +1,11 @@
 """
 Core mesh validation logic using trimesh and open3d
 """
+import os
+import secrets
 import time
-import uuid
-from typing import List, Tuple, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple, Dict, Any, Optional, Callable, Union, BinaryIO, Iterator
 import numpy as np
 import trimesh
 from datetime import datetime
@@ -16,11 +18,199 @@ except ImportError:
     OPEN3D_AVAILABLE = False
     o3d = None
 
+# Try to import scipy for the KD-tree broad phase, skip that check without it
+try:
+    from scipy.spatial import cKDTree
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+    cKDTree = None
+
+# Try to import numba for the JIT-compiled kernels, fall back to NumPy without it
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 from .models import (
     ValidationReport, ValidationIssue, MeshMetrics, 
     ValidationStatus, ErrorCode
 )
 
+# Errors and warnings produced by a single check
+CheckResult = Tuple[List[ValidationIssue], List[ValidationIssue]]
+
+# Meshes can be validated from a path or an open binary file object
+MeshSource = Union[str, os.PathLike, BinaryIO]
+
+# Shared by all validators in the process; created on first use
+_check_pool: Optional[ThreadPoolExecutor] = None
+
+
+def _get_check_pool() -> ThreadPoolExecutor:
+    """Thread pool for running independent checks side by side"""
+    global _check_pool
+    if _check_pool is None:
+        _check_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="modelguard-check")
+    return _check_pool
+
+
+def _overlapping_triangle_pairs(triangles: np.ndarray, block_size: int = 65_536,
+                                chunk_size: int = 10_000_000) -> Iterator[np.ndarray]:
+    """
+    Broad phase: pairs (i, j) of triangles whose bounding boxes overlap, in chunks
+    
+    Triangles are split by bounding-sphere radius. Typical ones are paired with
+    a KD-tree over their centroids; the few much larger than the median are
+    box-tested against every triangle directly, so one huge face doesn't widen
+    the KD-tree search radius for all the others.
+    
+    Centroids are sorted along the longest axis and paired one slab of
+    block_size at a time, so only one slab's candidates are in memory at once.
+    """
+    if len(triangles) < 2:
+        return
+    
+    lower = triangles.min(axis=1)
+    upper = triangles.max(axis=1)
+    centroids = triangles.mean(axis=1)
+    radii = np.linalg.norm(triangles - centroids[:, None], axis=2).max(axis=1)
+    
+    cutoff = 4 * np.median(radii)
+    small = np.nonzero(radii <= cutoff)[0]
+    large = np.nonzero(radii > cutoff)[0]
+    
+    def boxes_overlap(pairs: np.ndarray) -> np.ndarray:
+        first, second = pairs[:, 0], pairs[:, 1]
+        overlap = np.all((lower[first] <= upper[second]) & (lower[second] <= upper[first]), axis=1)
+        return pairs[overlap & (first != second)]
+    
+    # Two small triangles can only touch if their centroids are within both radii
+    distance = 2 * radii[small].max()
+    axis = np.argmax(np.ptp(centroids[small], axis=0))
+    order = small[np.argsort(centroids[small, axis], kind='stable')]
+    keys = centroids[order, axis]
+    for start in range(0, len(order), block_size):
+        end = min(start + block_size, len(order))
+        
+        # Pair the slab with everything up to one search distance past it; pairs
+        # whose first member lies beyond the slab are found by a later slab
+        stop = np.searchsorted(keys, keys[end - 1] + distance, side='right')
+        tree = cKDTree(centroids[order[start:stop]])
+        pairs = tree.query_pairs(distance, output_type='ndarray')
+        pairs = pairs[pairs.min(axis=1) < end - start]
+        yield boxes_overlap(order[start + pairs])
+    
+    # Large triangles against everything, skipping large/large pairs seen from the other side
+    rows = max(1, chunk_size // len(triangles))
+    for start in range(0, len(large), rows):
+        block = large[start:start + rows]
+        overlap = np.all((lower[block, None] <= upper[None]) & (lower[None] <= upper[block, None]), axis=2)
+        first, second = np.nonzero(overlap)
+        first = block[first]
+        keep = (radii[second] <= cutoff) | (first < second)
+        yield boxes_overlap(np.column_stack([first[keep], second[keep]]))
+
+
+def _triangles_intersect(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """
+    Whether triangle i of first intersects triangle i of second
+    
+    Two non-coplanar triangles intersect when an edge of one crosses the
+    other, so each pair is decided by six segment/triangle tests.
+    """
+    hit = np.zeros(len(first), dtype=bool)
+    for a, b in ((first, second), (second, first)):
+        for i in range(3):
+            edge_hit, _ = _segment_triangle_intersections(a[:, i], a[:, (i + 1) % 3], b)
+            hit |= edge_hit
+    return hit
+
+
+def _kernel_buffers(vertices: np.ndarray, faces: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    C-contiguous float64 vertex and int64 face buffers for the Numba kernels
+    
+    Numba compiles one specialization per dtype/layout, so normalizing inputs
+    keeps every call on the one warmed at import instead of JIT-compiling a new
+    one (e.g. for int32 faces or a strided view) in the middle of a request.
+    Vertices stay in double precision: the 1e-10 degenerate-area threshold is
+    far below float32 resolution for millimetre-scale coordinates.
+    """
+    return (np.ascontiguousarray(vertices, dtype=np.float64),
+            np.ascontiguousarray(faces, dtype=np.int64))
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _face_areas_kernel(vertices, faces):
+        """Per-face triangle areas without the (F, 3, 3) NumPy temporaries"""
+        areas = np.empty(faces.shape[0])
+        for i in prange(faces.shape[0]):
+            a = faces[i, 0]
+            b = faces[i, 1]
+            c = faces[i, 2]
+            ex = vertices[b, 0] - vertices[a, 0]
+            ey = vertices[b, 1] - vertices[a, 1]
+            ez = vertices[b, 2] - vertices[a, 2]
+            fx = vertices[c, 0] - vertices[a, 0]
+            fy = vertices[c, 1] - vertices[a, 1]
+            fz = vertices[c, 2] - vertices[a, 2]
+            cx = ey * fz - ez * fy
+            cy = ez * fx - ex * fz
+            cz = ex * fy - ey * fx
+            areas[i] = 0.5 * np.sqrt(cx * cx + cy * cy + cz * cz)
+        return areas
+
+    # Compile (or load from the on-disk cache) at import instead of on the first request
+    _face_areas_kernel(*_kernel_buffers(np.zeros((3, 3)), np.zeros((1, 3))))
+
+
+# Binary STL record: facet normal, three vertices, attribute byte count
+STL_RECORD_DTYPE = np.dtype([
+    ('normal', '<f4', (3,)),
+    ('vertices', '<f4', (3, 3)),
+    ('attributes', '<u2')
+])
+
+# Binary STL header: 80 byte comment followed by a uint32 triangle count
+STL_HEADER_SIZE = 84
+
+
+def _segment_triangle_intersections(starts: np.ndarray, ends: np.ndarray,
+                                    triangles: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized Möller–Trumbore test of segment i against triangle i
+    
+    Returns:
+        Hit mask and the position t in [0, 1] of each hit along its segment
+    """
+    direction = ends - starts
+    edge1 = triangles[:, 1] - triangles[:, 0]
+    edge2 = triangles[:, 2] - triangles[:, 0]
+    
+    p = np.cross(direction, edge2)
+    det = np.einsum('ij,ij->i', edge1, p)
+    parallel = np.abs(det) < 1e-12
+    inv_det = 1.0 / np.where(parallel, 1.0, det)
+    
+    offset = starts - triangles[:, 0]
+    u = np.einsum('ij,ij->i', offset, p) * inv_det
+    q = np.cross(offset, edge1)
+    v = np.einsum('ij,ij->i', direction, q) * inv_det
+    t = np.einsum('ij,ij->i', edge2, q) * inv_det
+    
+    hit = ~parallel & (u >= 0) & (v >= 0) & (u + v <= 1) & (t >= 0) & (t <= 1)
+    return hit, t
+
+
+def _face_areas(mesh: trimesh.Trimesh) -> np.ndarray:
+    """Per-face areas, using the Numba kernel when it is available"""
+    if NUMBA_AVAILABLE:
+        return _face_areas_kernel(*_kernel_buffers(mesh.vertices, mesh.faces))
+    return mesh.area_faces
+
 
 class MeshValidator:
     """Main mesh validation class"""
@@ -28,7 +218,9 @@ class MeshValidator:
     def __init__(self, 
                  thin_wall_threshold: float = 0.5,
                  min_volume_threshold: float = 1.0,
-                 max_file_size_mb: float = 100.0):
+                 max_file_size_mb: float = 100.0,
+                 fast_fail: bool = True,
+                 parallel_checks: bool = False):
         """
         Initialize validator with configurable thresholds
         
@@ -36,34 +228,47 @@ class MeshValidator:
             thin_wall_threshold: Minimum wall thickness in mm
             min_volume_threshold: Minimum volume in mm³
             max_file_size_mb: Maximum file size in MB
+            fast_fail: Skip the expensive warning-only checks once the
+                mesh already has a blocking error
+            parallel_checks: Run independent checks on a thread pool. Off by
+                default since the dominant cost (building trimesh's rtree)
+                holds the GIL, so threads only pay off for other workloads
         """
         self.thin_wall_threshold = thin_wall_threshold
         self.min_volume_threshold = min_volume_threshold
         self.max_file_size_mb = max_file_size_mb
+        self.fast_fail = fast_fail
+        self.parallel_checks = parallel_checks
         
-    def validate_mesh(self, file_path: str, filename: str) -> ValidationReport:
+    def validate_mesh(self, source: MeshSource, filename: str) -> ValidationReport:
         """
         Main validation pipeline
         
         Args:
-            file_path: Path to the uploaded file
-            filename: Original filename
+            source: Path to the uploaded file, or a binary file object
+            filename: Original filename (its extension gives the format of file objects)
             
         Returns:
             Complete validation report
         """
         start_time = time.time()
-        model_id = str(uuid.uuid4())
+        model_id = secrets.token_hex(16)
         
         try:
             # Load mesh
-            mesh = self._load_mesh(file_path)
+            mesh = self._load_mesh(source, filename)
+            
+            # Connected components are needed by both metrics and checks
+            n_components = self._count_components(mesh)
+            
+            # Face areas feed both the surface area metric and the degenerate check
+            face_areas = _face_areas(mesh)
             
-            # Compute basic metrics
-            metrics = self._compute_metrics(mesh)
+            # Compute basic metrics, keeping the raw values the checks reuse
+            metrics, raw = self._compute_metrics(mesh, n_components, face_areas)
             
             # Run validation checks
-            errors, warnings = self._run_validation_checks(mesh)
+            errors, warnings = self._run_validation_checks(mesh, n_components, face_areas, raw)
             
             # Determine final decision
             decision = self._determine_decision(errors, warnings)
@@ -101,10 +306,26 @@ class MeshValidator:
                 timestamp=datetime.utcnow().isoformat()
             )
     
-    def _load_mesh(self, file_path: str) -> trimesh.Trimesh:
-        """Load mesh from file with error handling"""
+    def _load_mesh(self, source: MeshSource, filename: Optional[str] = None) -> trimesh.Trimesh:
+        """
+        Load mesh from a path or a binary file object with error handling
+        
+        The format is taken from the path, or from filename for file objects.
+        """
         try:
-            mesh = trimesh.load(file_path)
+            is_path = isinstance(source, (str, os.PathLike))
+            file_type = os.path.splitext(source if is_path else filename)[1].lower()
+            
+            mesh = None
+            if file_type == '.stl':
+                mesh = self._load_binary_stl(source)
+            
+            if mesh is None:
+                # Skip trimesh's load-time processing; the only part we need is the weld below
+                if is_path:
+                    mesh = trimesh.load(source, process=False)
+                else:
+                    mesh = trimesh.load(source, file_type=file_type.lstrip('.'), process=False)
             
             # Ensure it's a single mesh
             if isinstance(mesh, trimesh.Scene):
@@ -116,38 +337,89 @@ class MeshValidator:
             
             if not hasattr(mesh, 'vertices') or len(mesh.vertices) == 0:
                 raise ValueError("Empty or invalid mesh")
+            
+            # STL stores every triangle corner separately, so weld shared corners once
+            mesh.merge_vertices()
                 
             return mesh
             
         except Exception as e:
             raise ValueError(f"Failed to load mesh: {str(e)}")
     
-    def _compute_metrics(self, mesh: trimesh.Trimesh) -> MeshMetrics:
-        """Compute basic mesh metrics"""
+    def _load_binary_stl(self, source: MeshSource) -> Optional[trimesh.Trimesh]:
+        """
+        Read a binary STL straight into NumPy, skipping trimesh's format sniffing
+        
+        Returns:
+            The unwelded mesh, or None if the source is not a well-formed binary STL
+            (a file object is then rewound to where it started)
+        """
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, 'rb') as f:
+                return self._load_binary_stl(f)
+        
+        start = source.tell()
+        header = source.read(STL_HEADER_SIZE)
+        if len(header) == STL_HEADER_SIZE:
+            n_triangles = int(np.frombuffer(header, dtype='<u4', count=1, offset=80)[0])
+            
+            # ASCII files (and truncated binaries) won't match the size the count implies
+            body_size = n_triangles * STL_RECORD_DTYPE.itemsize
+            if source.seek(0, os.SEEK_END) - start == STL_HEADER_SIZE + body_size:
+                source.seek(start + STL_HEADER_SIZE)
+                records = np.frombuffer(source.read(body_size), dtype=STL_RECORD_DTYPE)
+                
+                vertices = records['vertices'].reshape(-1, 3)
+                faces = np.arange(len(vertices)).reshape(-1, 3)
+                return trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+        
+        source.seek(start)
+        return None
+    
+    def _count_components(self, mesh: trimesh.Trimesh) -> int:
+        """Count connected components without building a submesh per component"""
+        components = trimesh.graph.connected_components(
+            mesh.face_adjacency,
+            nodes=np.arange(len(mesh.faces))
+        )
+        return len(components)
+    
+    def _raw_metrics(self, mesh: trimesh.Trimesh) -> Dict[str, Any]:
+        """Geometry values shared by the metrics and the validation checks"""
+        bounds = mesh.bounds
+        return {
+            "bounds": bounds,
+            "bbox_size": bounds[1] - bounds[0],  # [max_x - min_x, max_y - min_y, max_z - min_z]
+            "is_watertight": mesh.is_watertight
+        }
+    
+    def _compute_metrics(self, mesh: trimesh.Trimesh, n_components: int,
+                         face_areas: np.ndarray) -> Tuple[MeshMetrics, Dict[str, Any]]:
+        """
+        Compute basic mesh metrics
+        
+        Returns:
+            The metrics and the raw values from _raw_metrics (empty if they failed)
+        """
         try:
+            raw = self._raw_metrics(mesh)
+            
             # Basic counts
             triangles = len(mesh.faces)
             vertices = len(mesh.vertices)
             
-            # Bounding box
-            bbox = mesh.bounds
-            bbox_size = bbox[1] - bbox[0]  # [max_x - min_x, max_y - min_y, max_z - min_z]
-            
             # Volume and surface area
-            volume = mesh.volume if mesh.is_watertight else None
-            surface_area = mesh.surface_area
-            
-            # Connected components
-            components = len(mesh.split(only_watertight=False))
+            volume = mesh.volume if raw["is_watertight"] else None
+            surface_area = float(face_areas.sum())
             
             return MeshMetrics(
                 triangles=triangles,
                 vertices=vertices,
-                components=components,
-                bbox_mm=bbox_size.tolist(),
+                components=n_components,
+                bbox_mm=raw["bbox_size"].tolist(),
                 volume_mm3=volume,
                 surface_area_mm2=surface_area
-            )
+            ), raw
             
         except Exception as e:
             # Return basic metrics if computation fails
@@ -156,137 +428,276 @@ class MeshValidator:
                 vertices=len(mesh.vertices) if hasattr(mesh, 'vertices') else 0,
                 components=1,
                 bbox_mm=[0, 0, 0]
-            )
+            ), {}
     
-    def _run_validation_checks(self, mesh: trimesh.Trimesh) -> Tuple[List[ValidationIssue], List[ValidationIssue]]:
-        """Run all validation checks"""
-        errors = []
-        warnings = []
+    def _run_validation_checks(self, mesh: trimesh.Trimesh, n_components: int,
+                               face_areas: Optional[np.ndarray] = None,
+                               raw: Optional[Dict[str, Any]] = None
+                               ) -> Tuple[List[ValidationIssue], List[ValidationIssue]]:
+        """Run all validation checks, reusing the raw metrics when given"""
+        raw = raw or self._raw_metrics(mesh)
+        is_watertight = raw["is_watertight"]
         
-        # Watertightness check
-        if not mesh.is_watertight:
-            errors.append(ValidationIssue(
-                code=ErrorCode.NOT_WATERTIGHT,
-                message="Mesh is not watertight (has open boundaries)",
-                count=len(mesh.open_boundaries) if hasattr(mesh, 'open_boundaries') else None
-            ))
+        # Cheap checks that can block the mesh
+        errors, warnings = self._run_checks([
+            lambda: self._check_watertight(mesh, is_watertight),
+            lambda: self._check_winding(mesh),
+            lambda: self._check_flat(mesh, raw["bbox_size"]),
+            lambda: self._check_degenerate_faces(mesh, face_areas),
+        ])
+        
+        # The pairwise face search is the most expensive blocking check, so it only
+        # runs when the cheap checks haven't decided the mesh already. A flat mesh
+        # is reported as self-intersecting without it.
+        is_flat = any(error.code == ErrorCode.SELF_INTERSECTING for error in errors)
+        if not is_flat and (not errors or not self.fast_fail):
+            errors += self._check_self_intersection(mesh)[0]
         
-        # Manifold check
-        if not mesh.is_winding_consistent:
-            errors.append(ValidationIssue(
-                code=ErrorCode.NON_MANIFOLD,
-                message="Mesh has non-manifold edges"
+        # Multiple components check (count is already computed)
+        if n_components > 1:
+            warnings.append(ValidationIssue(
+                code=ErrorCode.MULTIPLE_COMPONENTS,
+                message=f"Mesh has {n_components} disconnected components",
+                count=n_components
             ))
         
-        # Self-intersection check (simplified - trimesh doesn't have intersects_self)
+        # The mesh is blocked either way, so skip the expensive warning-only checks
+        if errors and self.fast_fail:
+            return errors, warnings
+        
+        more_errors, more_warnings = self._run_checks([
+            lambda: self._check_duplicate_vertices(mesh),
+            lambda: self._check_thin_walls(mesh, is_watertight),
+        ])
+        return errors + more_errors, warnings + more_warnings
+    
+    def _run_checks(self, checks: List[Callable[[], CheckResult]]) -> CheckResult:
+        """
+        Run independent checks, concurrently when parallel_checks is enabled
+        
+        Results are concatenated in the order the checks are given, so the
+        report is the same either way.
+        """
+        if self.parallel_checks and len(checks) > 1:
+            pool = _get_check_pool()
+            futures = [pool.submit(check) for check in checks]
+            results = [future.result() for future in futures]
+        else:
+            results = [check() for check in checks]
+        
+        errors = [issue for check_errors, _ in results for issue in check_errors]
+        warnings = [issue for _, check_warnings in results for issue in check_warnings]
+        return errors, warnings
+    
+    def _check_watertight(self, mesh: trimesh.Trimesh,
+                          is_watertight: Optional[bool] = None) -> CheckResult:
+        """Watertightness check"""
+        if is_watertight is None:
+            is_watertight = mesh.is_watertight
+        if is_watertight:
+            return [], []
+        return [ValidationIssue(
+            code=ErrorCode.NOT_WATERTIGHT,
+            message="Mesh is not watertight (has open boundaries)",
+            count=len(mesh.open_boundaries) if hasattr(mesh, 'open_boundaries') else None
+        )], []
+    
+    def _check_winding(self, mesh: trimesh.Trimesh) -> CheckResult:
+        """Manifold check"""
+        if mesh.is_winding_consistent:
+            return [], []
+        return [ValidationIssue(
+            code=ErrorCode.NON_MANIFOLD,
+            message="Mesh has non-manifold edges"
+        )], []
+    
+    def _check_flat(self, mesh: trimesh.Trimesh,
+                    bbox_size: Optional[np.ndarray] = None) -> CheckResult:
+        """Flat bounding box check"""
+        if bbox_size is None and mesh.bounds is not None:
+            bbox_size = mesh.bounds[1] - mesh.bounds[0]
+        
+        # A mesh that is flat in some dimension folds onto itself
+        if bbox_size is not None and np.any(bbox_size < 1e-6):
+            return [ValidationIssue(
+                code=ErrorCode.SELF_INTERSECTING,
+                message="Mesh appears to have self-intersections or is extremely thin"
+            )], []
+        return [], []
+    
+    def _check_self_intersection(self, mesh: trimesh.Trimesh) -> CheckResult:
+        """Self-intersection check"""
+        # Without scipy there is no broad phase, and testing all pairs is too slow
+        if not SCIPY_AVAILABLE:
+            return [], []
         try:
-            # Use a simple bounding box check as a proxy for self-intersection
-            # This is a simplified approach - in production you'd want more sophisticated detection
-            if hasattr(mesh, 'bounds') and mesh.bounds is not None:
-                bbox_size = mesh.bounds[1] - mesh.bounds[0]
-                # If the mesh is extremely thin in any dimension, it might have self-intersections
-                if np.any(bbox_size < 1e-6):
-                    errors.append(ValidationIssue(
-                        code=ErrorCode.SELF_INTERSECTING,
-                        message="Mesh appears to have self-intersections or is extremely thin"
-                    ))
+            intersecting_pairs = self._find_self_intersections(mesh)
+            if len(intersecting_pairs) > 0:
+                return [ValidationIssue(
+                    code=ErrorCode.SELF_INTERSECTING,
+                    message=f"Found {len(intersecting_pairs)} pairs of intersecting faces",
+                    count=len(intersecting_pairs)
+                )], []
         except Exception:
             # If we can't check for self-intersections, skip this check
             pass
+        return [], []
+    
+    def _check_degenerate_faces(self, mesh: trimesh.Trimesh,
+                                face_areas: Optional[np.ndarray] = None) -> CheckResult:
+        """Degenerate faces check"""
+        degenerate_faces = self._find_degenerate_faces(mesh, face_areas)
+        if len(degenerate_faces) == 0:
+            return [], []
+        return [ValidationIssue(
+            code=ErrorCode.DEGENERATE_FACES,
+            message=f"Found {len(degenerate_faces)} degenerate faces",
+            count=len(degenerate_faces)
+        )], []
+    
+    def _check_duplicate_vertices(self, mesh: trimesh.Trimesh) -> CheckResult:
+        """Duplicate vertices check"""
+        duplicate_vertices = self._find_duplicate_vertices(mesh)
+        if len(duplicate_vertices) == 0:
+            return [], []
+        return [], [ValidationIssue(
+            code=ErrorCode.DUPLICATE_VERTICES,
+            message=f"Found {len(duplicate_vertices)} duplicate vertices",
+            count=len(duplicate_vertices)
+        )]
+    
+    def _check_thin_walls(self, mesh: trimesh.Trimesh,
+                          is_watertight: Optional[bool] = None) -> CheckResult:
+        """Thin wall detection (wall thickness is only meaningful on a closed surface)"""
+        if is_watertight is None:
+            is_watertight = mesh.is_watertight
+        thin_regions = self._detect_thin_walls(mesh) if is_watertight else []
+        if len(thin_regions) == 0:
+            return [], []
+        return [], [ValidationIssue(
+            code=ErrorCode.THIN_WALL,
+            message=f"Detected {len(thin_regions)} regions with thickness < {self.thin_wall_threshold}mm",
+            count=len(thin_regions)
+        )]
+    
+    def _find_self_intersections(self, mesh: trimesh.Trimesh,
+                                 chunk_size: int = 100_000) -> np.ndarray:
+        """
+        Find pairs of faces that intersect without sharing a vertex
         
-        # Multiple components check
-        components = mesh.split(only_watertight=False)
-        if len(components) > 1:
-            warnings.append(ValidationIssue(
-                code=ErrorCode.MULTIPLE_COMPONENTS,
-                message=f"Mesh has {len(components)} disconnected components",
-                count=len(components)
-            ))
-        
-        # Degenerate faces check
-        degenerate_faces = self._find_degenerate_faces(mesh)
-        if len(degenerate_faces) > 0:
-            errors.append(ValidationIssue(
-                code=ErrorCode.DEGENERATE_FACES,
-                message=f"Found {len(degenerate_faces)} degenerate faces",
-                count=len(degenerate_faces)
-            ))
+        Only pairs whose bounding boxes overlap get the exact triangle/triangle
+        test. Coplanar overlaps are not detected.
         
-        # Duplicate vertices check
-        duplicate_vertices = self._find_duplicate_vertices(mesh)
-        if len(duplicate_vertices) > 0:
-            warnings.append(ValidationIssue(
-                code=ErrorCode.DUPLICATE_VERTICES,
-                message=f"Found {len(duplicate_vertices)} duplicate vertices",
-                count=len(duplicate_vertices)
-            ))
+        Returns:
+            (n, 2) array of intersecting face index pairs
+        """
+        triangles = mesh.triangles
+        faces = mesh.faces
         
-        # Thin wall detection (simplified)
-        thin_regions = self._detect_thin_walls(mesh)
-        if len(thin_regions) > 0:
-            warnings.append(ValidationIssue(
-                code=ErrorCode.THIN_WALL,
-                message=f"Detected {len(thin_regions)} regions with thickness < {self.thin_wall_threshold}mm",
-                count=len(thin_regions)
-            ))
+        pairs = []
+        for candidates in _overlapping_triangle_pairs(triangles):
+            for start in range(0, len(candidates), chunk_size):
+                first, second = candidates[start:start + chunk_size].T
+                
+                # Neighbouring faces touch by design
+                shares_vertex = (faces[first][:, :, None] == faces[second][:, None, :]).any(axis=(1, 2))
+                first, second = first[~shares_vertex], second[~shares_vertex]
+                
+                hit = _triangles_intersect(triangles[first], triangles[second])
+                pairs.append(np.column_stack([first[hit], second[hit]]))
         
-        return errors, warnings
+        if not pairs:
+            return np.empty((0, 2), dtype=np.int64)
+        return np.concatenate(pairs)
     
-    def _find_degenerate_faces(self, mesh: trimesh.Trimesh) -> List[int]:
+    def _find_degenerate_faces(self, mesh: trimesh.Trimesh,
+                               face_areas: Optional[np.ndarray] = None) -> List[int]:
         """Find faces with zero area"""
-        degenerate = []
-        for i, face in enumerate(mesh.faces):
-            v0, v1, v2 = mesh.vertices[face]
-            # Calculate face area using cross product
-            area = 0.5 * np.linalg.norm(np.cross(v1 - v0, v2 - v0))
-            if area < 1e-10:  # Very small threshold
-                degenerate.append(i)
-        return degenerate
+        if face_areas is None:
+            face_areas = _face_areas(mesh)
+        return np.nonzero(face_areas < 1e-10)[0].tolist()
     
     def _find_duplicate_vertices(self, mesh: trimesh.Trimesh) -> List[int]:
-        """Find duplicate vertices (simplified approach)"""
-        # Use a simple distance-based approach
-        vertices = mesh.vertices
-        duplicates = []
-        
-        for i in range(len(vertices)):
-            for j in range(i + 1, len(vertices)):
-                if np.linalg.norm(vertices[i] - vertices[j]) < 1e-6:
-                    duplicates.append(i)
-                    break
-        
-        return duplicates
+        """Find duplicate vertices, compared at 1e-6 precision"""
+        if len(mesh.vertices) == 0:
+            return []
+
+        unique, _ = trimesh.grouping.unique_rows(mesh.vertices, digits=6)
+
+        # Every vertex except the first occurrence of its row is a duplicate
+        is_duplicate = np.ones(len(mesh.vertices), dtype=bool)
+        is_duplicate[unique] = False
+        return np.nonzero(is_duplicate)[0].tolist()
     
     def _detect_thin_walls(self, mesh: trimesh.Trimesh) -> List[Dict[str, Any]]:
         """
-        Detect thin wall regions (simplified implementation)
-        This is a basic implementation - in production, you'd want more sophisticated methods
+        Detect thin wall regions by casting a short segment inward from sampled
+        surface points and measuring the distance to the opposite surface
         """
         thin_regions = []
         
         try:
-            # Sample points on the surface and check distances to opposite surface
-            # This is a simplified approach - real implementation would be more complex
-            surface_points = mesh.sample(1000)  # Sample 1000 points
+            # Sample points together with the face each one lies on
+            surface_points, face_idx = mesh.sample(1000, return_index=True)
             
-            for point in surface_points[:10]:  # Check first 10 points for demo
-                # Find nearest point on opposite side (simplified)
-                distances = np.linalg.norm(mesh.vertices - point, axis=1)
-                nearest_idx = np.argmin(distances)
-                distance = distances[nearest_idx]
-                
-                if distance < self.thin_wall_threshold:
-                    thin_regions.append({
-                        "point": point.tolist(),
-                        "thickness": distance,
-                        "location": "surface"
-                    })
+            try:
+                thickness, sample_idx = self._ray_thickness(mesh, surface_points, face_idx)
+            except ImportError:
+                # No rtree available: fall back to the distance from each sample
+                # to its nearest vertex, batched through trimesh's cached KD-tree
+                thickness, _ = mesh.kdtree.query(surface_points, k=1, workers=-1)
+                sample_idx = np.arange(len(surface_points))
+            
+            thin = np.nonzero(thickness < self.thin_wall_threshold)[0]
+            thin_regions = [
+                {
+                    "point": surface_points[sample_idx[i]].tolist(),
+                    "thickness": float(thickness[i]),
+                    "location": "surface"
+                }
+                for i in thin
+            ]
         except Exception:
             # If sampling fails, return empty list
             pass
         
         return thin_regions
     
+    def _ray_thickness(self, mesh: trimesh.Trimesh, surface_points: np.ndarray,
+                       face_idx: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Distance from each sample to the opposite surface along its inward normal,
+        for samples whose opposite surface is closer than the thin wall threshold
+        
+        Returns:
+            Thickness per hit and the index of the sample each hit belongs to
+        """
+        normals = mesh.face_normals[face_idx]
+        
+        # Inward segments only as long as the threshold, starting just below the
+        # surface so they don't hit their own face
+        offset = 1e-4
+        starts = surface_points - normals * offset
+        ends = surface_points - normals * self.thin_wall_threshold
+        
+        # Broad phase: triangles whose bounding box overlaps each segment's box
+        tri_ids, counts = mesh.triangles_tree.intersection_v(
+            np.minimum(starts, ends), np.maximum(starts, ends)
+        )
+        pair_sample = np.repeat(np.arange(len(surface_points)), counts.astype(np.int64))
+        
+        # Narrow phase: exact segment/triangle intersection on the candidates
+        hit, t = _segment_triangle_intersections(
+            starts[pair_sample], ends[pair_sample], mesh.triangles[tri_ids]
+        )
+        pair_sample = pair_sample[hit]
+        pair_thickness = offset + t[hit] * (self.thin_wall_threshold - offset)
+        
+        # Keep the nearest hit per sample
+        order = np.lexsort((pair_thickness, pair_sample))
+        sample_idx, first = np.unique(pair_sample[order], return_index=True)
+        return pair_thickness[order][first], sample_idx
+    
     def _determine_decision(self, errors: List[ValidationIssue], warnings: List[ValidationIssue]) -> ValidationStatus:
         """Determine final validation decision based on errors and warnings"""
         if any(error.severity == "error" for error in errors):
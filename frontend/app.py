@@ -7,12 +7,13 @@ import json
 import time
 import plotly.graph_objects as go
 import plotly.express as px
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 import pandas as pd
 
 # Configuration
 API_BASE_URL = "http://localhost:8000"
 MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB
+REPORTS_PAGE_SIZE = 1000  # Largest page /reports serves
 
 # Page configuration
 st.set_page_config(
@@ -91,6 +92,22 @@ def upload_and_validate(file) -> Dict[str, Any]:
         return {"error": f"Upload failed: {str(e)}"}
 
 
+def fetch_all_reports() -> Optional[List[Dict[str, Any]]]:
+    """Fetch every stored report summary, following /reports pagination (None on API errors)"""
+    reports = []
+    while True:
+        response = requests.get(
+            f"{API_BASE_URL}/reports",
+            params={"limit": REPORTS_PAGE_SIZE, "offset": len(reports)}
+        )
+        if response.status_code != 200:
+            return None
+        page = response.json().get("reports", [])
+        reports.extend(page)
+        if len(page) < REPORTS_PAGE_SIZE:
+            return reports
+
+
 def display_validation_results(report: Dict[str, Any]):
     """Display validation results in a nice format"""
     
@@ -247,11 +264,8 @@ def main():
         st.header("📋 Validation Reports")
         
         try:
-            response = requests.get(f"{API_BASE_URL}/reports")
-            if response.status_code == 200:
-                reports_data = response.json()
-                reports = reports_data.get("reports", [])
-                
+            reports = fetch_all_reports()
+            if reports is not None:
                 if reports:
                     # Create DataFrame for display
                     df = pd.DataFrame(reports)
@@ -16,10 +16,23 @@ if __name__ == "__main__":
     print("🔍 Health check at: http://localhost:8000/health")
     print("\nPress Ctrl+C to stop the server")
     
+    # Auto-reload watches the source tree and is only wanted while developing
+    reload = os.getenv("MG_RELOAD") == "1"
+    if reload:
+        print("🔄 Auto-reload enabled (MG_RELOAD=1)")
+    
+    # Each server process owns a validation pool; split the cores between them.
+    # Validation runs in that pool, so one big upload never blocks health checks
+    # and a single server process is usually enough. Reports are kept in memory
+    # per process, so /report lookups only work reliably with one.
+    workers = int(os.getenv("MG_WORKERS", "1"))
+    os.environ.setdefault("MG_POOL_WORKERS", str(max(1, (os.cpu_count() or 1) // workers)))
+    
     uvicorn.run(
         "backend.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
-        log_level="info"
+        reload=reload,
+        log_level="info",
+        workers=workers
     )
@@ -2,7 +2,6 @@
 """
 Start the ModelGuard frontend server
 """
-import subprocess
 import sys
 import os
 
@@ -16,13 +15,17 @@ if __name__ == "__main__":
     print("\nPress Ctrl+C to stop the server")
     
     try:
-        subprocess.run([
-            sys.executable, "-m", "streamlit", "run", 
+        # Run streamlit's CLI in this interpreter instead of starting a second one
+        from streamlit.web import cli as stcli
+        
+        sys.argv = [
+            "streamlit", "run",
             "frontend/app.py",
             "--server.port=8501",
             "--server.address=0.0.0.0",
             "--server.headless=true"
-        ])
+        ]
+        sys.exit(stcli.main())
     except KeyboardInterrupt:
         print("\n👋 Frontend server stopped")
     except Exception as e:
@@ -0,0 +1,102 @@
+"""
+Tests for ModelGuard API endpoints
+"""
+import pytest
+import trimesh
+from fastapi.testclient import TestClient
+from backend import main
+from backend.storage import ReportStore
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Client with a running app (and validation pool) shared by the module"""
+    with pytest.MonkeyPatch.context() as patch:
+        # Two workers are plenty for the test meshes and start faster
+        patch.setattr(main, "VALIDATION_WORKERS", 2)
+        with TestClient(main.app) as test_client:
+            yield test_client
+
+
+@pytest.fixture(autouse=True)
+def empty_store(monkeypatch):
+    """Fresh report store per test, so cached reports don't leak between tests"""
+    store = ReportStore()
+    monkeypatch.setattr(main, "reports_storage", store)
+    return store
+
+
+def stl_bytes(mesh):
+    """Export a mesh as binary STL"""
+    return mesh.export(file_type='stl')
+
+
+CUBE = stl_bytes(trimesh.creation.box(extents=[10, 10, 10]))
+SPHERE = stl_bytes(trimesh.creation.icosphere(subdivisions=2, radius=5))
+
+
+class TestValidateEndpoints:
+    """Test cases for /validate and /validate/batch"""
+
+    def test_reupload_hits_cache(self, client, empty_store):
+        """Test that identical content is reported again under the new filename"""
+        first = client.post('/validate', files={'file': ('a.stl', CUBE)}).json()
+        second = client.post('/validate', files={'file': ('b.stl', CUBE)}).json()
+
+        assert second['filename'] == 'b.stl'
+        assert second['model_id'] != first['model_id']
+        assert second['metrics'] == first['metrics']
+        assert len(empty_store) == 2
+
+    def test_batch_keeps_upload_order(self, client):
+        """Test mixing cached, uncached, duplicate and invalid files in one batch"""
+        cached = client.post('/validate', files={'file': ('cached.stl', SPHERE)}).json()
+
+        response = client.post('/validate/batch', files=[
+            ('files', ('cube.stl', CUBE)),
+            ('files', ('sphere.stl', SPHERE)),
+            ('files', ('cube_copy.stl', CUBE)),
+            ('files', ('broken.stl', b'Invalid STL content')),
+        ])
+        assert response.status_code == 200
+
+        reports = response.json()
+        assert [report['filename'] for report in reports] == [
+            'cube.stl', 'sphere.stl', 'cube_copy.stl', 'broken.stl'
+        ]
+        assert [report['decision'] for report in reports] == ['ALLOW', 'ALLOW', 'ALLOW', 'BLOCK']
+        assert reports[1]['metrics'] == cached['metrics']
+        assert len({report['model_id'] for report in reports}) == 4
+
+    def test_batch_rejects_too_many_files(self, client):
+        """Test the per-batch file limit"""
+        files = [('files', (f'{i}.stl', CUBE)) for i in range(main.MAX_BATCH_FILES + 1)]
+
+        assert client.post('/validate/batch', files=files).status_code == 413
+
+    def test_unsupported_extension(self, client):
+        """Test that unsupported file types are rejected"""
+        response = client.post('/validate', files={'file': ('model.txt', b'not a mesh')})
+
+        assert response.status_code == 400
+
+
+class TestReportsEndpoint:
+    """Test cases for /reports"""
+
+    def test_pagination(self, client, empty_store):
+        """Test the JSON shape and limit/offset slicing of the report list"""
+        for name in ['a.stl', 'b.stl', 'c.stl']:
+            client.post('/validate', files={'file': (name, CUBE)})
+
+        page = client.get('/reports', params={'limit': 2, 'offset': 1}).json()
+        assert list(page) == ['reports']
+        assert [report['filename'] for report in page['reports']] == ['b.stl', 'c.stl']
+        assert set(page['reports'][0]) == {'model_id', 'filename', 'decision', 'timestamp'}
+
+        assert client.get('/reports', params={'offset': 3}).json() == {'reports': []}
+        assert client.get('/reports', params={'limit': 0}).status_code == 422
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
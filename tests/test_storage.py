@@ -0,0 +1,97 @@
+"""
+Tests for ModelGuard report storage
+"""
+import json
+import pytest
+from backend.models import ValidationReport, MeshMetrics, ValidationStatus
+from backend.storage import ReportStore
+
+
+def make_report(model_id):
+    """Create a minimal validation report"""
+    return ValidationReport(
+        model_id=model_id,
+        filename=f"{model_id}.stl",
+        metrics=MeshMetrics(triangles=12, vertices=8, components=1, bbox_mm=[10, 10, 10]),
+        decision=ValidationStatus.ALLOW,
+        processing_time_ms=1.0,
+        timestamp="2024-01-01T00:00:00"
+    )
+
+
+class TestReportStore:
+    """Test cases for ReportStore"""
+
+    def test_add_and_get(self):
+        """Test that stored reports round-trip as JSON"""
+        store = ReportStore()
+        store.add(make_report("a"))
+
+        assert "a" in store
+        assert json.loads(store.get("a"))["filename"] == "a.stl"
+        assert store.summaries() == [{
+            "model_id": "a",
+            "filename": "a.stl",
+            "decision": "ALLOW",
+            "timestamp": "2024-01-01T00:00:00"
+        }]
+
+    def test_oldest_report_is_evicted(self):
+        """Test that the store never grows past maxsize"""
+        store = ReportStore(maxsize=2)
+        for model_id in ["a", "b", "c"]:
+            store.add(make_report(model_id))
+
+        assert len(store) == 2
+        assert store.get("a") is None
+        assert [summary["model_id"] for summary in store.summaries()] == ["b", "c"]
+
+    def test_summaries_pagination(self):
+        """Test slicing the summaries with offset and limit"""
+        store = ReportStore()
+        for model_id in ["a", "b", "c", "d"]:
+            store.add(make_report(model_id))
+
+        page = store.summaries(offset=1, limit=2)
+        assert [summary["model_id"] for summary in page] == ["b", "c"]
+        assert len(store.summaries(offset=3)) == 1
+
+    def test_expired_reports_are_dropped(self):
+        """Test that reports disappear once their TTL has passed"""
+        store = ReportStore(ttl_seconds=0)
+        store.add(make_report("a"))
+
+        assert store.get("a") is None
+        assert store.summaries() == []
+
+    def test_delete(self):
+        """Test deleting present and missing reports"""
+        store = ReportStore()
+        store.add(make_report("a"))
+
+        assert store.delete("a") is True
+        assert store.delete("a") is False
+
+    def test_lookup_by_content_hash(self):
+        """Test that hash lookups follow the newest report through eviction and delete"""
+        store = ReportStore(maxsize=1)
+        store.add(make_report("a"), content_hash=".stl:abc")
+
+        assert json.loads(store.get_by_hash(".stl:abc"))["model_id"] == "a"
+        assert store.get_by_hash(".stl:def") is None
+
+        store.add(make_report("b"))
+        assert store.get_by_hash(".stl:abc") is None
+
+        # Removing an older report of the same content keeps the newer one's hash
+        store = ReportStore()
+        store.add(make_report("a"), content_hash=".stl:abc")
+        store.add(make_report("b"), content_hash=".stl:abc")
+
+        assert store.delete("a") is True
+        assert "b" in store
+        assert json.loads(store.get_by_hash(".stl:abc"))["model_id"] == "b"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -5,133 +5,246 @@ import pytest
 import numpy as np
 import trimesh
 import tempfile
-import os
+from io import BytesIO
+from pathlib import Path
+from types import SimpleNamespace
 from backend.validator import MeshValidator
 from backend.models import ValidationStatus, ErrorCode
 
 
+# 10mm cube centred on the origin, with outward-facing triangles
+_CUBE_V = np.array([
+    [-5, -5, -5], [-5, -5, 5], [-5, 5, -5], [-5, 5, 5],
+    [5, -5, -5], [5, -5, 5], [5, 5, -5], [5, 5, 5]
+], dtype=np.float64)
+_CUBE_F = np.array([
+    [1, 3, 0], [4, 1, 0], [0, 3, 2], [2, 4, 0], [1, 7, 3], [5, 1, 4],
+    [5, 7, 1], [3, 7, 2], [6, 4, 2], [2, 7, 6], [6, 5, 4], [7, 5, 6]
+], dtype=np.int64)
+
+
+def create_test_cube(watertight=True):
+    """Create a test cube mesh (without its last face if not watertight)"""
+    faces = _CUBE_F if watertight else _CUBE_F[:-1]
+    return trimesh.Trimesh(vertices=_CUBE_V, faces=faces, process=False)
+
+
+@pytest.fixture(scope="session")
+def tmp_stl_dir():
+    """One scratch directory for the session, removed as a whole at the end"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        yield Path(tmp_dir)
+
+
+@pytest.fixture(scope="session")
+def cube_stl_bytes():
+    """Watertight 10mm cube exported once for the whole session"""
+    return create_test_cube(watertight=True).export(file_type='stl')
+
+
+@pytest.fixture(scope="session")
+def watertight_cube_report(cube_stl_bytes):
+    """Report for the watertight cube, validated once and shared by read-only tests"""
+    return MeshValidator().validate_mesh(BytesIO(cube_stl_bytes), 'test_cube.stl')
+
+
+@pytest.fixture(scope="session")
+def open_cube_stl_bytes():
+    """Cube with one face removed, exported once for the whole session"""
+    return create_test_cube(watertight=False).export(file_type='stl')
+
+
 class TestMeshValidator:
     """Test cases for MeshValidator"""
     
-    def setup_method(self):
-        """Setup test fixtures"""
-        self.validator = MeshValidator()
-    
-    def create_test_cube(self, watertight=True):
-        """Create a test cube mesh"""
-        if watertight:
-            return trimesh.creation.box(extents=[10, 10, 10])
-        else:
-            # Create a non-watertight cube by removing one face
-            cube = trimesh.creation.box(extents=[10, 10, 10])
-            # Remove the last face to make it non-watertight
-            cube.faces = cube.faces[:-1]
-            return cube
+    @classmethod
+    def setup_class(cls):
+        """Share one validator (it only holds settings) and warm it up on a tiny cube"""
+        cls.validator = MeshValidator()
+        
+        # The first validation pays for trimesh's lazy imports and cache setup
+        cls.validator.validate_mesh(BytesIO(create_test_cube().export(file_type='stl')), 'warmup.stl')
     
-    def test_watertight_cube_validation(self):
+    def test_watertight_cube_validation(self, watertight_cube_report):
         """Test validation of a watertight cube"""
-        cube = self.create_test_cube(watertight=True)
+        report = watertight_cube_report
         
-        # Save to temporary file
-        with tempfile.NamedTemporaryFile(suffix='.stl', delete=False) as tmp:
-            cube.export(tmp.name)
-            
-            try:
-                report = self.validator.validate_mesh(tmp.name, 'test_cube.stl')
-                
-                # Should have no errors
-                assert len(report.errors) == 0
-                assert report.decision == ValidationStatus.ALLOW
-                assert report.metrics.triangles == 12  # Cube has 12 triangles
-                assert report.metrics.vertices == 8   # Cube has 8 vertices
-                
-            finally:
-                os.unlink(tmp.name)
+        # Should have no errors
+        assert len(report.errors) == 0
+        assert report.decision == ValidationStatus.ALLOW
+        assert report.metrics.triangles == 12  # Cube has 12 triangles
+        assert report.metrics.vertices == 8   # Cube has 8 vertices
     
-    def test_non_watertight_cube_validation(self):
+    def test_non_watertight_cube_validation(self, open_cube_stl_bytes):
         """Test validation of a non-watertight cube"""
-        cube = self.create_test_cube(watertight=False)
+        report = self.validator.validate_mesh(BytesIO(open_cube_stl_bytes), 'test_cube.stl')
         
-        # Save to temporary file
-        with tempfile.NamedTemporaryFile(suffix='.stl', delete=False) as tmp:
-            cube.export(tmp.name)
-            
-            try:
-                report = self.validator.validate_mesh(tmp.name, 'test_cube.stl')
-                
-                # Should have watertight error
-                assert len(report.errors) > 0
-                assert any(error.code == ErrorCode.NOT_WATERTIGHT for error in report.errors)
-                assert report.decision == ValidationStatus.BLOCK
-                
-            finally:
-                os.unlink(tmp.name)
+        # Should have watertight error
+        assert len(report.errors) > 0
+        assert any(error.code == ErrorCode.NOT_WATERTIGHT for error in report.errors)
+        assert report.decision == ValidationStatus.BLOCK
     
-    def test_metrics_computation(self):
+    def test_metrics_computation(self, watertight_cube_report):
         """Test that metrics are computed correctly"""
-        cube = self.create_test_cube(watertight=True)
+        metrics = watertight_cube_report.metrics
+        assert metrics.triangles == 12
+        assert metrics.vertices == 8
+        assert metrics.components == 1
+        assert len(metrics.bbox_mm) == 3
+        assert (np.asarray(metrics.bbox_mm) > 0).all()
+    
+    def test_binary_stl_fast_path(self, cube_stl_bytes):
+        """Test that the binary STL fixtures are read by the NumPy fast path"""
+        mesh = self.validator._load_binary_stl(BytesIO(cube_stl_bytes))
         
-        with tempfile.NamedTemporaryFile(suffix='.stl', delete=False) as tmp:
-            cube.export(tmp.name)
-            
-            try:
-                report = self.validator.validate_mesh(tmp.name, 'test_cube.stl')
-                
-                metrics = report.metrics
-                assert metrics.triangles == 12
-                assert metrics.vertices == 8
-                assert metrics.components == 1
-                assert len(metrics.bbox_mm) == 3
-                assert all(dim > 0 for dim in metrics.bbox_mm)
-                
-            finally:
-                os.unlink(tmp.name)
+        assert mesh is not None
+        assert len(mesh.faces) == 12
     
+    def test_ascii_stl_validation(self):
+        """Test that ASCII STL files bypass the binary fast path and still load"""
+        cube = create_test_cube(watertight=True)
+        source = BytesIO(cube.export(file_type='stl_ascii').encode())
+
+        assert self.validator._load_binary_stl(source) is None
+        assert source.tell() == 0
+
+        report = self.validator.validate_mesh(source, 'test_cube.stl')
+        assert report.decision == ValidationStatus.ALLOW
+        assert report.metrics.vertices == 8
+
+    def test_path_and_file_object_agree(self, cube_stl_bytes, tmp_stl_dir):
+        """Test that a path and a file object with the same content give the same metrics"""
+        path = tmp_stl_dir / "cube.stl"
+        path.write_bytes(cube_stl_bytes)
+
+        from_path = self.validator.validate_mesh(str(path), 'test_cube.stl')
+        from_buffer = self.validator.validate_mesh(BytesIO(cube_stl_bytes), 'test_cube.stl')
+        assert from_path.metrics == from_buffer.metrics
+
+    def test_multiple_components_warning(self):
+        """Test that disconnected bodies are counted and reported"""
+        first = trimesh.creation.box(extents=[10, 10, 10])
+        second = trimesh.creation.box(extents=[10, 10, 10])
+        second.apply_translation([30, 0, 0])
+        mesh = trimesh.util.concatenate([first, second])
+
+        report = self.validator.validate_mesh(BytesIO(mesh.export(file_type='stl')), 'two_cubes.stl')
+
+        assert report.metrics.components == 2
+        assert any(warning.code == ErrorCode.MULTIPLE_COMPONENTS for warning in report.warnings)
+
     def test_invalid_file_handling(self):
         """Test handling of invalid files"""
-        # Create a temporary file with invalid content
-        with tempfile.NamedTemporaryFile(suffix='.stl', delete=False) as tmp:
-            tmp.write(b"Invalid STL content")
-            tmp.flush()
-            
-            try:
-                report = self.validator.validate_mesh(tmp.name, 'invalid.stl')
-                
-                # Should have errors and be blocked
-                assert len(report.errors) > 0
-                assert report.decision == ValidationStatus.BLOCK
-                
-            finally:
-                os.unlink(tmp.name)
+        report = self.validator.validate_mesh(BytesIO(b"Invalid STL content"), 'invalid.stl')
+        
+        # Should have errors and be blocked
+        assert len(report.errors) > 0
+        assert report.decision == ValidationStatus.BLOCK
     
-    def test_decision_logic(self):
-        """Test decision logic based on errors and warnings"""
-        # Test with errors
-        errors = [{"code": ErrorCode.NOT_WATERTIGHT, "message": "Test error", "severity": "error"}]
-        warnings = []
-        decision = self.validator._determine_decision(
-            [type('obj', (), error) for error in errors],
-            [type('obj', (), warning) for warning in warnings]
+    def test_degenerate_face_detection(self):
+        """Test that zero-area faces are reported by index"""
+        mesh = trimesh.Trimesh(
+            vertices=[[0, 0, 0], [1, 0, 0], [2, 0, 0], [0, 1, 0]],
+            faces=[[0, 1, 2], [0, 1, 3]],
+            process=False
         )
-        assert decision == ValidationStatus.BLOCK
-        
-        # Test with warnings only
-        errors = []
-        warnings = [{"code": ErrorCode.THIN_WALL, "message": "Test warning", "severity": "warning"}]
-        decision = self.validator._determine_decision(
-            [type('obj', (), error) for error in errors],
-            [type('obj', (), warning) for warning in warnings]
+
+        assert self.validator._find_degenerate_faces(mesh) == [0]
+
+    def test_duplicate_vertex_detection(self):
+        """Test that coincident vertices are reported once per extra copy"""
+        mesh = trimesh.Trimesh(
+            vertices=[[0, 0, 0], [1, 0, 0], [0, 1, 0], [1, 0, 0], [1, 0, 0]],
+            faces=[[0, 1, 2]],
+            process=False
         )
-        assert decision == ValidationStatus.ALLOW_WITH_WARNINGS
-        
-        # Test with no issues
-        errors = []
-        warnings = []
+
+        assert len(self.validator._find_duplicate_vertices(mesh)) == 2
+
+    def test_thin_wall_detection(self):
+        """Test that a plate thinner than the threshold is flagged"""
+        plate = trimesh.creation.box(extents=[10, 10, 0.2])
+        cube = create_test_cube(watertight=True)
+
+        assert len(self.validator._detect_thin_walls(plate)) > 0
+        assert len(self.validator._detect_thin_walls(cube)) == 0
+
+    def test_self_intersection_detection(self):
+        """Test that interpenetrating bodies are flagged and separate ones are not"""
+        first = trimesh.creation.box(extents=[10, 10, 10])
+        overlapping = trimesh.creation.box(extents=[10, 10, 10])
+        overlapping.apply_translation([5, 5, 5])
+        separate = trimesh.creation.box(extents=[10, 10, 10])
+        separate.apply_translation([30, 0, 0])
+
+        intersecting = trimesh.util.concatenate([first, overlapping])
+        errors, _ = self.validator._check_self_intersection(intersecting)
+        assert [error.code for error in errors] == [ErrorCode.SELF_INTERSECTING]
+        assert errors[0].count > 0
+
+        disjoint = trimesh.util.concatenate([first, separate])
+        assert len(self.validator._find_self_intersections(disjoint)) == 0
+
+    def test_fast_fail_skips_warning_checks(self, monkeypatch):
+        """Test that expensive and warning-only checks are skipped once a blocking error is found"""
+        # Open box with an extra unreferenced copy of one corner
+        box = trimesh.creation.box(extents=[10, 10, 10])
+        mesh = trimesh.Trimesh(
+            vertices=np.vstack([box.vertices, box.vertices[:1]]),
+            faces=box.faces[1:],
+            process=False
+        )
+
+        searched = []
+        monkeypatch.setattr(MeshValidator, "_find_self_intersections",
+                            lambda validator, mesh: searched.append(mesh) or [])
+
+        errors, warnings = MeshValidator(fast_fail=True)._run_validation_checks(mesh, 1)
+        assert any(error.code == ErrorCode.NOT_WATERTIGHT for error in errors)
+        assert not any(warning.code == ErrorCode.DUPLICATE_VERTICES for warning in warnings)
+        assert searched == []
+
+        errors, warnings = MeshValidator(fast_fail=False)._run_validation_checks(mesh, 1)
+        assert any(warning.code == ErrorCode.DUPLICATE_VERTICES for warning in warnings)
+        assert searched == [mesh]
+
+    def test_parallel_checks_match_serial(self):
+        """Test that running checks on the thread pool gives the same issues in the same order"""
+        # Open mesh with a degenerate face, so several checks report issues
+        mesh = trimesh.Trimesh(
+            vertices=[[0, 0, 0], [1, 0, 0], [0, 1, 0], [2, 0, 0]],
+            faces=[[0, 1, 2], [0, 1, 3]],
+            process=False
+        )
+
+        serial = MeshValidator(parallel_checks=False)._run_validation_checks(mesh, 2)
+        parallel = MeshValidator(parallel_checks=True)._run_validation_checks(mesh, 2)
+
+        assert serial == parallel
+        assert [error.code for error in parallel[0]] == [
+            ErrorCode.NOT_WATERTIGHT,
+            ErrorCode.NON_MANIFOLD,
+            ErrorCode.SELF_INTERSECTING,
+            ErrorCode.DEGENERATE_FACES
+        ]
+
+    @pytest.mark.parametrize("errors,warnings,expected", [
+        # Errors block the mesh
+        ([{"code": ErrorCode.NOT_WATERTIGHT, "message": "Test error", "severity": "error"}], [],
+         ValidationStatus.BLOCK),
+        # Warnings only
+        ([], [{"code": ErrorCode.THIN_WALL, "message": "Test warning", "severity": "warning"}],
+         ValidationStatus.ALLOW_WITH_WARNINGS),
+        # No issues
+        ([], [], ValidationStatus.ALLOW),
+    ])
+    def test_decision_logic(self, errors, warnings, expected):
+        """Test decision logic based on errors and warnings"""
         decision = self.validator._determine_decision(
-            [type('obj', (), error) for error in errors],
-            [type('obj', (), warning) for warning in warnings]
+            [SimpleNamespace(**error) for error in errors],
+            [SimpleNamespace(**warning) for warning in warnings]
         )
-        assert decision == ValidationStatus.ALLOW
+        assert decision == expected
 
 
 if __name__ == "__main__":